@@ -9,13 +9,17 @@ Endpoints:
 - WS   /ws/score       - Stream audio for real-time scoring
 """
 
+import asyncio
 import io
+import logging
 import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import Optional
 
 import bcrypt
 import numpy as np
+import orjson
 import torch
 from bson import ObjectId
 from dotenv import load_dotenv
@@ -31,18 +35,24 @@ from fastapi import (
     status,
 )
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from jose import JWTError, jwt
 from phonemizer import phonemize
 from pydantic import BaseModel, EmailStr
+from pymongo.errors import DuplicateKeyError
 from db import get_users_collection
 import soundfile as sf
 from transformers import Wav2Vec2ForCTC, Wav2Vec2Processor
 from dtw import dtw
-from pronunciation_model import get_model
+import pronunciation_model
+from pronunciation_model import BATCH_MAX_SIZE, get_model
 
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
 # =============================================================================
 # CONFIGURATION
 # =============================================================================
@@ -51,12 +61,25 @@ JWT_SECRET_KEY = os.getenv("JWT_SECRET_KEY", "zylo-jwt-secret-key-change-me")
 JWT_ALGORITHM = "HS256"
 JWT_EXPIRATION_DAYS = 1
 
+# bcrypt cost factor: 10 rounds is ~4x cheaper than the library default of 12.
+# Existing hashes keep working since the cost is stored in the hash itself.
+BCRYPT_ROUNDS = 10
+
 MONGO_URI = os.getenv("MONGO_URI", "mongodb://localhost:27017/dyslexia_assistant")
 
-@app.on_event("startup")
-async def startup_db_client():
-    from db import init_db
-    init_db()
+# Uploads above this are rejected before decoding (~5 min of 16 kHz 16-bit mono WAV)
+MAX_AUDIO_BYTES = int(os.getenv("ZYLO_MAX_AUDIO_BYTES", 10_000_000))
+
+# Dedicated pool for model.evaluate, separate from the default executor used by
+# bcrypt. It needs at least BATCH_MAX_SIZE threads so concurrent requests can
+# fill a micro-batch.
+INFERENCE_WORKERS = int(os.getenv("ZYLO_INFERENCE_WORKERS", max(os.cpu_count() or 1, BATCH_MAX_SIZE)))
+INFERENCE_POOL = ThreadPoolExecutor(max_workers=INFERENCE_WORKERS, thread_name_prefix="zylo-infer")
+
+
+async def run_inference(func, *args):
+    """Run a blocking model call on the inference pool."""
+    return await asyncio.get_running_loop().run_in_executor(INFERENCE_POOL, func, *args)
 
 
 # =============================================================================
@@ -67,13 +90,18 @@ security = HTTPBearer()
 
 
 def hash_password(password: str) -> bytes:
-    return bcrypt.hashpw(password.encode("utf-8"), bcrypt.gensalt())
+    return bcrypt.hashpw(password.encode("utf-8"), bcrypt.gensalt(rounds=BCRYPT_ROUNDS))
 
 
 def verify_password(password: str, password_hash: bytes) -> bool:
     return bcrypt.checkpw(password.encode("utf-8"), password_hash)
 
 
+def needs_rehash(password_hash: bytes) -> bool:
+    # bcrypt hashes look like $2b$<cost>$<salt+hash>
+    return int(password_hash.split(b"$")[2]) != BCRYPT_ROUNDS
+
+
 def create_access_token(user_id: str) -> str:
     expire = datetime.utcnow() + timedelta(days=JWT_EXPIRATION_DAYS)
     payload = {"sub": user_id, "exp": expire}
@@ -146,6 +174,7 @@ app = FastAPI(
     title="ZYLO Pronunciation Scorer",
     description="Phoneme-based pronunciation scoring with Wav2Vec2 + Auth",
     version="1.0.0",
+    default_response_class=ORJSONResponse,
 )
 
 app.add_middleware(
@@ -156,6 +185,23 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress larger JSON bodies (long phoneme lists); small responses go out as-is
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
+
+@app.on_event("startup")
+async def startup_db_client():
+    from db import init_db, ensure_indexes
+    init_db()
+    await ensure_indexes()
+
+
+@app.on_event("startup")
+async def startup_load_model():
+    # Load and warm up the model before serving so the first request doesn't pay for it
+    model = get_model()
+    await run_inference(model.warmup)
+
 
 # =============================================================================
 # AUTH ENDPOINTS
@@ -169,16 +215,22 @@ async def register(req: RegisterRequest):
 
     users = get_users_collection()
 
-    if await users.find_one({"email": req.email.lower()}):
+    # Existence check only, so fetch just the _id
+    if await users.find_one({"email": req.email.lower()}, {"_id": 1}):
         raise HTTPException(status_code=409, detail="Email already registered")
 
     user_doc = {
         "email": req.email.lower(),
-        "password_hash": hash_password(req.password),
+        "password_hash": await asyncio.to_thread(hash_password, req.password),
         "name": req.name,
         "created_at": datetime.utcnow(),
     }
-    result = await users.insert_one(user_doc)
+    try:
+        result = await users.insert_one(user_doc)
+    except DuplicateKeyError:
+        # A concurrent registration won the race past the check above; the
+        # unique index on email rejects this one
+        raise HTTPException(status_code=409, detail="Email already registered")
     user_doc["_id"] = result.inserted_id
 
     token = create_access_token(str(user_doc["_id"]))
@@ -195,11 +247,21 @@ async def register(req: RegisterRequest):
 async def login(req: LoginRequest):
     """Login and receive JWT token."""
     users = get_users_collection()
-    user = await users.find_one({"email": req.email.lower()})
+    user = await users.find_one(
+        {"email": req.email.lower()}, {"email": 1, "name": 1, "password_hash": 1}
+    )
 
-    if not user or not verify_password(req.password, user["password_hash"]):
+    # bcrypt is CPU-bound; hash off the event loop so other requests keep flowing
+    if not user or not await asyncio.to_thread(verify_password, req.password, user["password_hash"]):
         raise HTTPException(status_code=401, detail="Invalid email or password")
 
+    # Migrate hashes made with an older cost factor while we have the password
+    if needs_rehash(user["password_hash"]):
+        await users.update_one(
+            {"_id": user["_id"]},
+            {"$set": {"password_hash": await asyncio.to_thread(hash_password, req.password)}},
+        )
+
     token = create_access_token(str(user["_id"]))
 
     return {
@@ -214,7 +276,7 @@ async def login(req: LoginRequest):
 async def get_me(user_id: str = Depends(get_current_user_id)):
     """Get current authenticated user."""
     users = get_users_collection()
-    user = await users.find_one({"_id": ObjectId(user_id)})
+    user = await users.find_one({"_id": ObjectId(user_id)}, {"email": 1, "name": 1})
 
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
@@ -238,7 +300,10 @@ async def logout():
 @app.get("/health", response_model=HealthResponse)
 async def health_check():
     """Check API health."""
-    return {"status": "healthy", "model_loaded": _model is not None}
+    # Returned directly so the payload isn't re-validated against HealthResponse
+    return ORJSONResponse(
+        {"status": "healthy", "model_loaded": pronunciation_model._model is not None}
+    )
 
 
 @app.post("/score", response_model=ScoreResponse)
@@ -251,9 +316,26 @@ async def score_pronunciation(
 
     Returns phoneme-level similarity score (0.0 - 1.0).
     """
-    audio_bytes = await audio.read()
+    if audio.size is not None and audio.size > MAX_AUDIO_BYTES:
+        raise HTTPException(status_code=413, detail=f"Audio exceeds {MAX_AUDIO_BYTES} bytes")
+
     model = get_model()
-    return model.evaluate(audio_bytes, text)
+    # Decode straight from the spooled upload instead of copying it into a bytes
+    # object first; inference runs in a worker thread so the event loop keeps
+    # serving other clients
+    try:
+        result = await run_inference(model.evaluate, audio.file, text)
+    except ValueError as e:
+        # e.g. a clip too short to produce a single model frame
+        raise HTTPException(status_code=400, detail=str(e))
+    # Returning the response directly skips re-validating the result against
+    # ScoreResponse, which is kept for the OpenAPI schema
+    return ORJSONResponse(result)
+
+
+async def ws_send_json(websocket: WebSocket, data: dict):
+    # orjson instead of send_json's stdlib json; still a text frame
+    await websocket.send_text(orjson.dumps(data, option=orjson.OPT_SERIALIZE_NUMPY).decode())
 
 
 @app.websocket("/ws/score")
@@ -273,25 +355,29 @@ async def websocket_score(websocket: WebSocket):
 
     try:
         while True:
-            text_msg = await websocket.receive_json()
+            text_msg = orjson.loads(await websocket.receive_text())
             reference_text = text_msg.get("text", "")
 
             if not reference_text:
-                await websocket.send_json({"error": "No reference text provided"})
+                await ws_send_json(websocket, {"error": "No reference text provided"})
                 continue
 
             audio_bytes = await websocket.receive_bytes()
+            if len(audio_bytes) > MAX_AUDIO_BYTES:
+                await ws_send_json(websocket, {"error": f"Audio exceeds {MAX_AUDIO_BYTES} bytes"})
+                continue
 
             try:
-                result = model.evaluate(audio_bytes, reference_text)
-                await websocket.send_json(result)
+                # Off the event loop, so concurrent clients can share a batched forward pass
+                result = await run_inference(model.evaluate, audio_bytes, reference_text)
+                await ws_send_json(websocket, result)
             except Exception as e:
-                await websocket.send_json({"error": str(e)})
+                await ws_send_json(websocket, {"error": str(e)})
 
     except WebSocketDisconnect:
-        print("[WS] Client disconnected")
+        logger.info("[WS] Client disconnected")
     except Exception as e:
-        print(f"[WS] Error: {e}")
+        logger.warning("[WS] Error: %s", e)
         await websocket.close()
 
 
@@ -302,6 +388,8 @@ async def websocket_score(websocket: WebSocket):
 if __name__ == "__main__":
     import uvicorn
 
+    logging.basicConfig(level=logging.INFO)
+
     print("=" * 60)
     print("  ZYLO Pronunciation Scorer API")
     print("=" * 60)
@@ -317,4 +405,18 @@ if __name__ == "__main__":
     print("  WS   /ws/score       - WebSocket streaming")
     print()
 
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    # Each worker process loads its own copy of the Wav2Vec2 model, so this
+    # defaults to one. On CPU-only hosts more workers scale throughput; torch
+    # threads are split between them so they don't oversubscribe the cores.
+    workers = int(os.getenv("ZYLO_WORKERS", "1"))
+    if workers > 1:
+        os.environ.setdefault("OMP_NUM_THREADS", str(max(1, (os.cpu_count() or 1) // workers)))
+
+    # uvicorn's "auto" loop/http pick uvloop + httptools (uvicorn[standard])
+    # when they are installed and fall back to asyncio + h11 elsewhere (Windows)
+    uvicorn.run(
+        "api_server:app" if workers > 1 else app,
+        host="0.0.0.0",
+        port=8000,
+        workers=workers,
+    )
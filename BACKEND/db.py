@@ -7,12 +7,25 @@ load_dotenv()
 client = None
 db = None
 
+# Connection pool bounds per process; minPoolSize keeps a connection warm so the
+# first request after idle doesn't pay for the TCP/TLS handshake
+MONGO_MAX_POOL_SIZE = int(os.getenv('MONGO_MAX_POOL_SIZE', 50))
+MONGO_MIN_POOL_SIZE = int(os.getenv('MONGO_MIN_POOL_SIZE', 1))
+
 def init_db():
     global client, db
+    # Idempotent: one Motor client (which pools connections) per process
+    if db is not None:
+        return db
     mongo_uri = os.getenv('MONGO_URI', 'mongodb://localhost:27017/dyslexia_assistant')
     try:
         # Reduced timeout for faster error feedback in dev (increased to 5s for Atlas)
-        client = AsyncIOMotorClient(mongo_uri, serverSelectionTimeoutMS=5000)
+        client = AsyncIOMotorClient(
+            mongo_uri,
+            serverSelectionTimeoutMS=5000,
+            maxPoolSize=MONGO_MAX_POOL_SIZE,
+            minPoolSize=MONGO_MIN_POOL_SIZE,
+        )
         # Note: motor client creation is non-blocking. 
         # We can't easily check connection here without making this async.
         # Connection verification should happen in an async startup event.
@@ -43,3 +56,13 @@ def get_users_collection():
 
 def get_history_collection():
     return get_db()['history']
+
+async def ensure_indexes():
+    """Create the indexes the auth and history queries rely on (no-op if they exist)."""
+    try:
+        await get_users_collection().create_index("email", unique=True)
+        # Per-user history, newest first
+        await get_history_collection().create_index([("user_id", 1), ("updated_at", -1)])
+        print('[OK] MongoDB indexes ready')
+    except Exception as e:
+        print(f'[ERROR] Could not create MongoDB indexes: {e}')
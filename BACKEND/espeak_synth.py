@@ -0,0 +1,111 @@
+"""
+In-process eSpeak speech synthesis via ctypes.
+
+Calls libespeak-ng (or libespeak) directly and collects the PCM samples
+from the synth callback, instead of forking the `espeak` CLI and going
+through a temporary WAV file.
+"""
+
+import ctypes
+import ctypes.util
+import os
+import threading
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+# espeak_AUDIO_OUTPUT / espeak_PARAMETER / espeak_POSITION_TYPE values from speak_lib.h
+AUDIO_OUTPUT_SYNCHRONOUS = 2
+ESPEAK_RATE = 1
+POS_CHARACTER = 1
+ESPEAK_CHARS_UTF8 = 1
+# espeak_Initialize option: return an error instead of calling exit(1) on failure
+ESPEAK_INITIALIZE_DONT_EXIT = 0x8000
+
+_SYNTH_CALLBACK = ctypes.CFUNCTYPE(
+    ctypes.c_int, ctypes.POINTER(ctypes.c_short), ctypes.c_int, ctypes.c_void_p
+)
+
+
+def _find_library() -> Optional[str]:
+    # Same override the phonemizer backend honours (see test scripts)
+    path = os.getenv("PHONEMIZER_ESPEAK_LIBRARY")
+    if path:
+        return path
+    return ctypes.util.find_library("espeak-ng") or ctypes.util.find_library("espeak")
+
+
+class EspeakSynthesizer:
+    """
+    Thread-safe wrapper around a single libespeak instance.
+    The library is loaded lazily on the first call to `synthesize`.
+    """
+
+    def __init__(self, voice: str = "en", rate: int = 150):
+        self.voice = voice
+        self.rate = rate
+        self.sample_rate = 0
+        self._lib = None
+        self._chunks: List[np.ndarray] = []
+        # Keep a reference so the C callback is not garbage collected
+        self._callback = _SYNTH_CALLBACK(self._on_samples)
+        self._lock = threading.Lock()
+
+    def _load(self):
+        path = _find_library()
+        if path is None:
+            raise RuntimeError("libespeak-ng not found (set PHONEMIZER_ESPEAK_LIBRARY)")
+
+        lib = ctypes.cdll.LoadLibrary(path)
+        lib.espeak_Initialize.argtypes = [ctypes.c_int, ctypes.c_int, ctypes.c_char_p, ctypes.c_int]
+        lib.espeak_SetSynthCallback.argtypes = [_SYNTH_CALLBACK]
+        lib.espeak_SetVoiceByName.argtypes = [ctypes.c_char_p]
+        lib.espeak_SetParameter.argtypes = [ctypes.c_int, ctypes.c_int, ctypes.c_int]
+        lib.espeak_Synth.argtypes = [
+            ctypes.c_void_p, ctypes.c_size_t, ctypes.c_uint, ctypes.c_int,
+            ctypes.c_uint, ctypes.c_uint, ctypes.c_void_p, ctypes.c_void_p,
+        ]
+
+        sample_rate = lib.espeak_Initialize(
+            AUDIO_OUTPUT_SYNCHRONOUS, 0, None, ESPEAK_INITIALIZE_DONT_EXIT
+        )
+        if sample_rate <= 0:
+            raise RuntimeError("espeak_Initialize failed")
+
+        lib.espeak_SetSynthCallback(self._callback)
+        lib.espeak_SetVoiceByName(self.voice.encode("utf-8"))
+        lib.espeak_SetParameter(ESPEAK_RATE, self.rate, 0)
+
+        self.sample_rate = sample_rate
+        self._lib = lib
+
+    def _on_samples(self, wav, num_samples, events) -> int:
+        if num_samples > 0:
+            self._chunks.append(np.ctypeslib.as_array(wav, shape=(num_samples,)).copy())
+        return 0  # 0 = continue synthesis
+
+    def synthesize(self, text: str) -> Tuple[np.ndarray, int]:
+        """
+        Synthesize text to speech.
+        Returns: (float32 audio in [-1, 1], sample rate)
+        """
+        with self._lock:
+            if self._lib is None:
+                self._load()
+
+            self._chunks = []
+            data = text.encode("utf-8") + b"\0"
+            err = self._lib.espeak_Synth(
+                data, len(data), 0, POS_CHARACTER, 0, ESPEAK_CHARS_UTF8, None, None
+            )
+            if err != 0:
+                raise RuntimeError(f"espeak_Synth failed with error {err}")
+            self._lib.espeak_Synchronize()
+
+            chunks, self._chunks = self._chunks, []
+
+        if not chunks:
+            return np.zeros(0, dtype=np.float32), self.sample_rate
+
+        pcm = np.concatenate(chunks)
+        return pcm.astype(np.float32) / 32768.0, self.sample_rate
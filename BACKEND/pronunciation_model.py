@@ -1,12 +1,194 @@
+import functools
+import hashlib
 import io
+import logging
+import math
 import os
+import queue
+import threading
+import time
+from concurrent.futures import Future
 import numpy as np
 import torch
 import soundfile as sf
-from typing import Optional, List, Dict, Any, Tuple
+from typing import Optional, List, Dict, Any, Tuple, Union, BinaryIO
+from cachetools import LRUCache
 from transformers import Wav2Vec2ForCTC, Wav2Vec2Processor
 from dtw import dtw
-from phonemizer import phonemize
+from espeak_synth import EspeakSynthesizer
+from numba import njit
+from phonemizer.backend import EspeakBackend
+
+logger = logging.getLogger(__name__)
+
+try:
+    from rapidfuzz.distance import Levenshtein
+except ImportError:  # fall back to the numba kernel below
+    Levenshtein = None
+
+# Reference texts repeat heavily in practice sessions, so their TTS
+# probabilities and phonemes are cached by text
+REF_PROBS_CACHE_BYTES = 128 * 1024 * 1024  # host memory, not entries: sizes vary with text length
+PHONEME_CACHE_SIZE = 4096
+RESULT_CACHE_SIZE = 4096
+
+# Opt-in (ZYLO_SKIP_DECISIVE=1): symbol scores at or beyond these bounds skip
+# the probability (TTS) comparison, and similarity_score is then the symbol
+# score alone. No band is status-preserving: the combined score
+# 0.6 * prob + 0.4 * symbol can land anywhere in [0.4 * symbol, 0.4 * symbol + 0.6],
+# which crosses a status threshold for every symbol score. These bounds trade
+# that for latency and are not tuned against labelled data.
+SYMBOL_SCORE_SKIP_HIGH = 0.9
+SYMBOL_SCORE_SKIP_LOW = 0.2
+
+# Micro-batching: concurrent requests arriving within BATCH_WINDOW_MS share one
+# padded forward pass of up to BATCH_MAX_SIZE clips. Clips longer than
+# BATCH_LONG_SAMPLES are batched separately so short ones aren't padded to them.
+BATCH_MAX_SIZE = 8
+BATCH_WINDOW_MS = 20
+BATCH_LONG_SAMPLES = 16000 * 2
+
+# Audio longer than WINDOW_SAMPLES is encoded as overlapping windows (batched
+# together) and the logits stitched back, capping attention memory per clip.
+# Overlap is a multiple of 2 * FRAME_STRIDE so each side drops whole frames.
+WINDOW_SAMPLES = 16000 * 4
+WINDOW_OVERLAP = 6400
+FRAME_STRIDE = 320  # samples per Wav2Vec2 output frame
+MIN_AUDIO_SAMPLES = 400  # receptive field of the first output frame
+
+# Compiled-model warm-up: Dynamo keeps a separate graph for batch size 1 and,
+# within it, guards on input-length ranges (each roughly double the last), so
+# single clips are warmed up on a x1.25 ladder over every length the batcher
+# can send. Padded batches share one graph, except when the longest clip is a
+# single frame.
+_WARMUP_STEPS = int(math.log(WINDOW_SAMPLES / MIN_AUDIO_SAMPLES, 1.25))
+WARMUP_LENGTHS = sorted(
+    {int(MIN_AUDIO_SAMPLES * 1.25 ** k) for k in range(_WARMUP_STEPS + 1)} | {WINDOW_SAMPLES}
+)
+WARMUP_BATCHES = [[MIN_AUDIO_SAMPLES, MIN_AUDIO_SAMPLES], [16000, 24000]]
+# Dynamo's default of 8 graphs per function is below what the shapes above
+# need; past the limit it silently runs eager for new shapes
+COMPILE_RECOMPILE_LIMIT = 32
+
+
+@njit(cache=True)
+def _levenshtein(ref_ids: np.ndarray, hyp_ids: np.ndarray) -> int:
+    """Edit distance between two int32 id sequences using two rolling rows."""
+    m, n = ref_ids.shape[0], hyp_ids.shape[0]
+    prev = np.empty(n + 1, dtype=np.int32)
+    curr = np.empty(n + 1, dtype=np.int32)
+    for j in range(n + 1):
+        prev[j] = j
+
+    for i in range(1, m + 1):
+        curr[0] = i
+        for j in range(1, n + 1):
+            if ref_ids[i - 1] == hyp_ids[j - 1]:
+                curr[j] = prev[j - 1]
+            else:
+                curr[j] = 1 + min(prev[j], curr[j - 1], prev[j - 1])
+        prev, curr = curr, prev
+
+    return prev[n]
+
+
+@njit(cache=True, fastmath=True)
+def _dtw_binary(ref_ids: np.ndarray, hyp_ids: np.ndarray) -> float:
+    """
+    DTW distance with a 0/1 mismatch cost between two int32 id sequences.
+    Uses the symmetric2 step pattern (diagonal steps weighted 2x), matching
+    dtw-python's default, with two rolling rows of the cumulative cost.
+    """
+    n, m = ref_ids.shape[0], hyp_ids.shape[0]
+    prev = np.empty(m, dtype=np.int32)
+    curr = np.empty(m, dtype=np.int32)
+
+    prev[0] = 1 if ref_ids[0] != hyp_ids[0] else 0
+    for j in range(1, m):
+        prev[j] = prev[j - 1] + (1 if ref_ids[0] != hyp_ids[j] else 0)
+
+    for i in range(1, n):
+        r = ref_ids[i]
+        cost = 1 if r != hyp_ids[0] else 0
+        curr[0] = prev[0] + cost
+        for j in range(1, m):
+            cost = 1 if r != hyp_ids[j] else 0
+            curr[j] = min(prev[j - 1] + 2 * cost, prev[j] + cost, curr[j - 1] + cost)
+        prev, curr = curr, prev
+
+    return float(prev[m - 1])
+
+
+def _audio_digest(audio_data: Union[bytes, BinaryIO]) -> bytes:
+    """128-bit BLAKE2b digest of encoded audio; file objects are rewound afterwards."""
+    h = hashlib.blake2b(digest_size=16)
+    if isinstance(audio_data, (bytes, bytearray)):
+        h.update(audio_data)
+    else:
+        start = audio_data.tell()
+        for chunk in iter(lambda: audio_data.read(1 << 16), b""):
+            h.update(chunk)
+        audio_data.seek(start)
+    return h.digest()
+
+
+def _normalize_padded(
+    input_values: torch.Tensor, lengths: torch.Tensor, do_normalize: bool, padding_value: float
+) -> torch.Tensor:
+    """
+    Wav2Vec2FeatureExtractor's zero-mean/unit-variance normalization (over the
+    valid samples only) and padding value, applied to a zero-padded batch
+    [batch, samples] on its own device. `lengths` must be on the same device.
+    """
+    valid = torch.arange(input_values.shape[1], device=input_values.device)[None, :] < lengths[:, None]
+    if do_normalize:
+        counts = lengths.to(input_values.dtype)[:, None]
+        mean = input_values.sum(dim=1, keepdim=True) / counts
+        var = (((input_values - mean) * valid) ** 2).sum(dim=1, keepdim=True) / counts
+        input_values = (input_values - mean) / torch.sqrt(var + 1e-7)
+    return input_values.masked_fill(~valid, padding_value)
+
+
+def _split_windows(audio: np.ndarray) -> List[np.ndarray]:
+    """Split audio into WINDOW_SAMPLES windows overlapping by WINDOW_OVERLAP samples."""
+    if len(audio) <= WINDOW_SAMPLES:
+        return [audio]
+    hop = WINDOW_SAMPLES - WINDOW_OVERLAP
+    return [audio[i:i + WINDOW_SAMPLES] for i in range(0, len(audio) - WINDOW_OVERLAP, hop)]
+
+
+def _stitch_windows(window_logits: List[torch.Tensor]) -> torch.Tensor:
+    """
+    Join per-window logits from `_split_windows`, keeping each overlap's first
+    half from the earlier window and its second half from the later one.
+    """
+    if len(window_logits) == 1:
+        return window_logits[0]
+    margin = WINDOW_OVERLAP // FRAME_STRIDE // 2
+    hop_frames = (WINDOW_SAMPLES - WINDOW_OVERLAP) // FRAME_STRIDE
+    last = len(window_logits) - 1
+    return torch.cat([
+        logits[(0 if w == 0 else margin):(logits.shape[0] if w == last else hop_frames + margin)]
+        for w, logits in enumerate(window_logits)
+    ])
+
+
+# One espeak backend for the process: phonemize() builds (and tears down) a new
+# backend on every call, which costs ~10x the phonemization itself
+_g2p_backend: Optional[EspeakBackend] = None
+_g2p_lock = threading.Lock()
+
+
+@functools.lru_cache(maxsize=PHONEME_CACHE_SIZE)
+def _phonemize_cached(text: str) -> Tuple[str, ...]:
+    global _g2p_backend
+    # The backend is not thread-safe
+    with _g2p_lock:
+        if _g2p_backend is None:
+            _g2p_backend = EspeakBackend("en-us")
+        ph = _g2p_backend.phonemize([text], strip=True)[0]
+    return tuple(ph.split())
+
 
 class PronunciationModel:
     """
@@ -18,24 +200,36 @@ class PronunciationModel:
     """
 
     _instance = None
+    _lock = threading.Lock()
 
     def __new__(cls):
-        if cls._instance is None:
-            cls._instance = super().__new__(cls)
-            cls._instance._initialized = False
+        with cls._lock:
+            if cls._instance is None:
+                cls._instance = super().__new__(cls)
+                cls._instance._initialized = False
         return cls._instance
 
     def __init__(self):
-        if self._initialized:
-            return
+        # Concurrent first requests must not load the model twice
+        with self._lock:
+            if not self._initialized:
+                self._load()
 
+    def _load(self):
+        """Load processor + model once; called under the class lock."""
         # Use phoneme-output model (outputs IPA directly from audio)
         # This model outputs phonemes like /f/ /ɑ/ /k/ /s/ instead of letters
         print("[MODEL] Loading Wav2Vec2 Phoneme Model...")
         model_name = "facebook/wav2vec2-xlsr-53-espeak-cv-ft"
         
         self.processor = Wav2Vec2Processor.from_pretrained(model_name)
-        self.model = Wav2Vec2ForCTC.from_pretrained(model_name)
+        try:
+            # Fused scaled-dot-product attention kernels (FlashAttention /
+            # memory-efficient backends on CUDA) instead of eager matmul+softmax
+            self.model = Wav2Vec2ForCTC.from_pretrained(model_name, attn_implementation="sdpa")
+        except (ValueError, TypeError, ImportError):
+            # Older transformers/torch without SDPA support for Wav2Vec2
+            self.model = Wav2Vec2ForCTC.from_pretrained(model_name)
         self.model.eval()
 
         # Check for MPS (Apple Silicon) or CUDA
@@ -48,51 +242,218 @@ class PronunciationModel:
             
         self.model.to(self.device)
 
+        # Optional INT8 dynamic quantization of the Linear layers for CPU-only
+        # hosts (ZYLO_QUANTIZE=1): roughly half the memory and faster matmuls,
+        # at a small accuracy cost
+        self._quantized = self.device == "cpu" and os.getenv("ZYLO_QUANTIZE") == "1"
+        if self._quantized:
+            self.model = torch.ao.quantization.quantize_dynamic(
+                self.model, {torch.nn.Linear}, dtype=torch.qint8
+            )
+
+        # Mixed-precision autocast: always on CUDA (Tensor Cores), in BF16 where
+        # the GPU supports it natively (Ampere+) and FP16 on older GPUs (T4,
+        # V100) that only emulate BF16; opt-in BF16 on CPU via ZYLO_CPU_BF16=1
+        # for chips with native BF16 (AVX-512 BF16 / AMX), where it is faster,
+        # and slower everywhere else
+        self._autocast_dtype: Optional[torch.dtype] = None
+        if self.device == "cuda":
+            self._autocast_dtype = (
+                torch.bfloat16
+                if torch.cuda.is_bf16_supported(including_emulation=False)
+                else torch.float16
+            )
+        elif self.device == "cpu" and os.getenv("ZYLO_CPU_BF16") == "1" and not self._quantized:
+            self._autocast_dtype = torch.bfloat16
+
+        # Fuse kernels with TorchInductor; dynamic shapes because every
+        # utterance has a different length. MPS is not supported by Inductor,
+        # and the quantized Linear modules run through their own kernels.
+        # ZYLO_COMPILE=0 keeps eager mode (e.g. for faster restarts in dev).
+        # Default mode, not "reduce-overhead": its CUDA graphs are recorded per
+        # input shape, and audio length differs on nearly every request.
+        # Warm-up (with silence) makes compilation, for every graph the shapes
+        # below select, and kernel selection happen here rather than inside the
+        # first requests. Compiled code is shared across threads, so this also
+        # covers the batch worker thread.
+        compiled = (
+            os.getenv("ZYLO_COMPILE", "1") == "1"
+            and self.device != "mps"
+            and not self._quantized
+        )
+        if compiled:
+            torch._dynamo.config.cache_size_limit = max(
+                torch._dynamo.config.cache_size_limit, COMPILE_RECOMPILE_LIMIT
+            )
+            eager_model = self.model
+            try:
+                self.model = torch.compile(self.model, dynamic=True)
+                # Inductor compiles lazily, so most failures surface on these calls
+                for lengths in [[n] for n in WARMUP_LENGTHS] + WARMUP_BATCHES:
+                    self._forward(*self._prepare_inputs([np.zeros(n, dtype=np.float32) for n in lengths]))
+            except Exception as e:
+                # e.g. no C++ toolchain or an unsupported platform: serve eager
+                logger.warning("[MODEL] torch.compile failed, falling back to eager mode: %s", e)
+                self.model = eager_model
+                compiled = False
+        if not compiled:
+            for lengths in ([16000], [16000, 24000]):
+                self._forward(*self._prepare_inputs([np.zeros(n, dtype=np.float32) for n in lengths]))
+
+        # Phoneme string -> integer id, grown lazily as new symbols appear
+        self._phoneme_vocab: Dict[str, int] = {}
+
+        # Opt-in: skip the TTS comparison when the symbol score is outside
+        # (SYMBOL_SCORE_SKIP_LOW, SYMBOL_SCORE_SKIP_HIGH). Off by default because
+        # it can change the returned status (see evaluate).
+        self._skip_decisive = os.getenv("ZYLO_SKIP_DECISIVE") == "1"
+
+        # In-process TTS for the reference audio (library loads on first use)
+        self._espeak = EspeakSynthesizer(voice="en", rate=150)
+
+        # reference_text -> frame probabilities of its TTS audio, kept on the
+        # host (not in GPU memory) and bounded by their total size in bytes
+        self._ref_probs_cache: LRUCache = LRUCache(
+            maxsize=REF_PROBS_CACHE_BYTES, getsizeof=lambda t: t.numel() * t.element_size()
+        )
+        # Full results keyed by (audio digest, reference text), for retries of the same clip
+        self._result_cache: LRUCache = LRUCache(maxsize=RESULT_CACHE_SIZE)
+
+        # Guards the vocab and cache above; evaluate runs on worker threads
+        self._state_lock = threading.Lock()
+
+        # Requests for frame probabilities are queued and served in batches
+        self._infer_queue: "queue.Queue[Tuple[np.ndarray, Future]]" = queue.Queue()
+        threading.Thread(target=self._batch_worker, name="zylo-batcher", daemon=True).start()
+
         print(f"[MODEL] Wav2Vec2 Phoneme Model ready on {self.device}")
         self._initialized = True
 
-    def load_audio(self, audio_bytes: bytes) -> Tuple[np.ndarray, int]:
-        """Load and normalize audio from bytes."""
-        audio, sr = sf.read(io.BytesIO(audio_bytes))
-        if len(audio.shape) > 1:
-            audio = audio[:, 0]  # Convert to mono
+    def warmup(self):
+        """
+        Exercise the lazily initialised pieces of evaluate once: the numba
+        kernels (JIT on first call), phonemizer and the eSpeak library.
+        """
+        try:
+            phonemes = self.text_to_phonemes("hello world")
+            self.compute_dtw_similarity(phonemes, phonemes)
+            self.compute_phoneme_error_rate(phonemes, phonemes)
+            self.text_to_audio("hello world")
+            print("[MODEL] Warmup complete")
+        except Exception as e:
+            print(f"[WARN] Warmup failed: {e}")
+
+    def load_audio(self, audio_data: Union[bytes, BinaryIO]) -> Tuple[np.ndarray, int]:
+        """Load and normalize audio from bytes or a seekable binary file object."""
+        if isinstance(audio_data, (bytes, bytearray)):
+            audio_data = io.BytesIO(audio_data)
+        audio, sr = sf.read(audio_data, dtype="float32", always_2d=False)
+        if audio.ndim > 1:
+            audio = audio.mean(axis=1, dtype=np.float32)  # Downmix to mono
         
-        # Peak normalization
-        if np.max(np.abs(audio)) > 0:
-            audio = audio / np.max(np.abs(audio))
+        # Peak normalization, in place and without an np.abs temporary
+        peak = max(-audio.min(), audio.max()) if audio.size else 0.0
+        if peak > 0:
+            audio *= 1.0 / peak
             
         return audio, sr
 
-    def get_phoneme_logits(self, audio: np.ndarray) -> Tuple[torch.Tensor, str]:
+    def _prepare_inputs(self, audios: List[np.ndarray]) -> Tuple[torch.Tensor, torch.Tensor]:
+        """
+        Pad and zero-mean/unit-variance normalize a batch of 16kHz audios.
+        Returns: (input_values [batch, samples], attention_mask [batch, samples] on CPU)
+        On CUDA the raw audio is uploaded once from pinned memory and normalized
+        on the GPU instead of by the CPU feature extractor.
+        """
+        if self.device != "cuda":
+            inputs = self.processor(
+                audios,
+                sampling_rate=16000,
+                return_tensors="pt",
+                padding=True,
+                return_attention_mask=True,
+            )
+            return inputs.input_values, inputs.attention_mask
+
+        lengths = torch.tensor([len(a) for a in audios])
+        max_len = int(lengths.max())
+        attention_mask = (torch.arange(max_len)[None, :] < lengths[:, None]).long()
+
+        # Pad into pinned host memory so the whole batch goes over in one
+        # asynchronous host-to-device copy
+        host = torch.zeros(len(audios), max_len, pin_memory=True)
+        for i, audio in enumerate(audios):
+            host[i, :len(audio)] = torch.from_numpy(np.asarray(audio, dtype=np.float32))
+        input_values = host.to(self.device, non_blocking=True)
+
+        # Same normalization and padding as the processor's feature extractor
+        fe = self.processor.feature_extractor
+        input_values = _normalize_padded(
+            input_values, lengths.to(self.device), fe.do_normalize, fe.padding_value
+        )
+
+        return input_values, attention_mask
+
+    def _forward(self, input_values: torch.Tensor, attention_mask: Optional[torch.Tensor] = None) -> torch.Tensor:
+        """
+        Run the Wav2Vec2 model and return FP32 logits [batch, frames, vocab_size].
+        On CUDA (and CPU with ZYLO_CPU_BF16=1) the forward runs under BF16/FP16 autocast.
+        """
+        with torch.inference_mode(), torch.autocast(
+            device_type="cuda" if self.device == "cuda" else "cpu",
+            dtype=self._autocast_dtype or torch.bfloat16,
+            enabled=self._autocast_dtype is not None,
+        ):
+            if attention_mask is not None:
+                attention_mask = attention_mask.to(self.device)
+            outputs = self.model(input_values.to(self.device), attention_mask=attention_mask)
+        # Softmax/argmax downstream stay in FP32 for numerical stability
+        return outputs.logits.float()
+
+    def get_phoneme_logits(self, audio: np.ndarray) -> Tuple[torch.Tensor, str, np.ndarray]:
         """
         Extract frame-level phoneme logits from audio.
-        Returns: (logits tensor, predicted phoneme sequence)
+        Returns: (logits tensor, predicted phoneme sequence, predicted ids [frames])
         """
-        inputs = self.processor(audio, sampling_rate=16000, return_tensors="pt", padding=True)
-        
-        with torch.no_grad():
-            outputs = self.model(inputs.input_values.to(self.device))
-            logits = outputs.logits  # Shape: [batch, frames, vocab_size]
+        # Batched and windowed like the rest of inference
+        logits = self._encode(audio).unsqueeze(0)  # Shape: [batch, frames, vocab_size]
         
-        # Get predicted phoneme IDs
-        pred_ids = torch.argmax(logits, dim=-1)
+        # Get predicted phoneme IDs; the single explicit device->host copy
+        pred_ids = torch.argmax(logits[0], dim=-1).cpu().numpy()
         
         # Decode to phoneme string
-        phoneme_str = self.processor.decode(pred_ids[0])
+        phoneme_str = self.processor.decode(pred_ids)
         
-        return logits, phoneme_str
+        return logits, phoneme_str, pred_ids
+
+    def get_phoneme_ids(self, audio: np.ndarray) -> np.ndarray:
+        """
+        Frame-level argmax phoneme ids [frames] as a host array.
+        Lighter than get_phoneme_logits: logits are dropped and nothing is decoded.
+        """
+        return torch.argmax(self._encode(audio), dim=-1).cpu().numpy()
 
     def audio_to_phonemes(self, audio: np.ndarray) -> List[str]:
         """Extract phoneme sequence directly from audio using the phoneme model."""
-        _, phoneme_str = self.get_phoneme_logits(audio)
+        phoneme_str = self.processor.decode(self.get_phoneme_ids(audio))
         # Clean up and split into individual phonemes
         phonemes = phoneme_str.strip().split()
         return [p for p in phonemes if p]  # Remove empty strings
 
     def text_to_phonemes(self, text: str) -> List[str]:
-        """Convert reference text to phonemes using espeak."""
-        ph = phonemize(text, language="en-us", backend="espeak", strip=True)
-        return ph.split()
+        """Convert reference text to phonemes using espeak (memoized per text)."""
+        return list(_phonemize_cached(text))
+
+    def phonemes_to_ids(self, phonemes: List[str]) -> np.ndarray:
+        """Map phoneme symbols to int32 ids so comparisons run on integers."""
+        vocab = self._phoneme_vocab
+        # Locked so concurrent requests never hand out the same id twice
+        with self._state_lock:
+            return np.fromiter(
+                (vocab.setdefault(p, len(vocab)) for p in phonemes),
+                dtype=np.int32,
+                count=len(phonemes),
+            )
 
     def compute_phoneme_error_rate(self, reference: List[str], hypothesis: List[str]) -> float:
         """
@@ -103,23 +464,14 @@ class PronunciationModel:
         if not reference:
             return 1.0 if hypothesis else 0.0
         
-        # Dynamic programming for edit distance
-        m, n = len(reference), len(hypothesis)
-        dp = [[0] * (n + 1) for _ in range(m + 1)]
-        
-        for i in range(m + 1):
-            dp[i][0] = i
-        for j in range(n + 1):
-            dp[0][j] = j
-        
-        for i in range(1, m + 1):
-            for j in range(1, n + 1):
-                if reference[i-1] == hypothesis[j-1]:
-                    dp[i][j] = dp[i-1][j-1]
-                else:
-                    dp[i][j] = 1 + min(dp[i-1][j], dp[i][j-1], dp[i-1][j-1])
-        
-        edit_distance = dp[m][n]
+        if Levenshtein is not None:
+            # Bit-parallel C++ edit distance; hashes the phoneme strings itself
+            edit_distance = Levenshtein.distance(reference, hypothesis)
+        else:
+            # Edit distance on integer ids (JIT-compiled, O(n) memory)
+            edit_distance = _levenshtein(
+                self.phonemes_to_ids(reference), self.phonemes_to_ids(hypothesis)
+            )
         per = edit_distance / len(reference)
         return min(per, 1.0)  # Cap at 1.0
 
@@ -128,12 +480,9 @@ class PronunciationModel:
         if not expected_ph or not spoken_ph:
             return 0.0
         
-        alignment = dtw(
-            np.array(expected_ph).reshape(-1, 1),
-            np.array(spoken_ph).reshape(-1, 1),
-            lambda x, y: 0 if x == y else 1,
+        dist = _dtw_binary(
+            self.phonemes_to_ids(expected_ph), self.phonemes_to_ids(spoken_ph)
         )
-        dist = alignment.distance
         return round(max(0, 1 - (dist / max(len(expected_ph), 1))), 4)
 
     # =========================================================================
@@ -142,60 +491,131 @@ class PronunciationModel:
     
     def text_to_audio(self, text: str) -> np.ndarray:
         """
-        Generate audio from text using eSpeak TTS.
+        Generate audio from text using in-process eSpeak TTS.
         Returns audio as numpy array at 16kHz.
         """
-        import subprocess
-        import tempfile
+        audio, sr = self._espeak.synthesize(text)
         
-        with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as tmp:
-            tmp_path = tmp.name
+        # Resample to 16kHz if needed (espeak outputs at 22050Hz). Polyphase
+        # FIR at the reduced rational ratio (320/441) instead of a full FFT.
+        if sr != 16000:
+            from scipy import signal
+            g = math.gcd(sr, 16000)
+            audio = signal.resample_poly(audio, 16000 // g, sr // g)
         
-        try:
-            # Use espeak to generate audio file
-            subprocess.run(
-                ["espeak", "-w", tmp_path, "-s", "150", text],
-                check=True,
-                capture_output=True
-            )
-            
-            # Read the generated audio
-            audio, sr = sf.read(tmp_path)
-            
-            # Convert to mono if needed
-            if len(audio.shape) > 1:
-                audio = audio[:, 0]
-            
-            # Resample to 16kHz if needed (espeak outputs at 22050Hz by default)
-            if sr != 16000:
-                from scipy import signal
-                num_samples = int(len(audio) * 16000 / sr)
-                audio = signal.resample(audio, num_samples)
-            
-            return audio.astype(np.float32)
-            
-        finally:
-            # Clean up temp file
-            if os.path.exists(tmp_path):
-                os.remove(tmp_path)
+        return audio.astype(np.float32, copy=False)
 
-    def get_frame_probabilities(self, audio: np.ndarray) -> np.ndarray:
+    def _reference_audio(self, text: str) -> np.ndarray:
+        """TTS audio for a reference text, checked to be long enough to encode."""
+        audio = self.text_to_audio(text)
+        if len(audio) < MIN_AUDIO_SAMPLES:
+            raise ValueError(f"Reference audio too short: {len(audio)} samples")
+        return audio
+
+    def _cache_ref_probs(self, text: str, ref_logits: torch.Tensor) -> torch.Tensor:
+        """Softmax the reference logits and cache them on the host by text."""
+        ref_probs = torch.softmax(ref_logits, dim=-1).cpu()
+        with self._state_lock:
+            self._ref_probs_cache[text] = ref_probs
+        return ref_probs
+
+    def get_frame_probabilities(self, audio: np.ndarray) -> torch.Tensor:
         """
         Extract frame-level phoneme probability distributions from audio.
-        Returns: numpy array of shape [num_frames, vocab_size]
+        Returns: tensor of shape [num_frames, vocab_size], left on the model device
+        """
+        return self.get_frame_probabilities_batch([audio])[0]
+
+    def get_frame_probabilities_batch(self, audios: List[np.ndarray]) -> List[torch.Tensor]:
+        """
+        Frame-level probabilities for several audios (batched with concurrent callers).
+        Returns: one [num_frames, vocab_size] tensor per input
+        """
+        return [torch.softmax(logits, dim=-1) for logits in self._encode_batch(audios)]
+
+    def _encode(self, audio: np.ndarray) -> torch.Tensor:
+        """Logits [num_frames, vocab_size] for one audio, on the model device."""
+        return self._encode_batch([audio])[0]
+
+    def _encode_batch(self, audios: List[np.ndarray]) -> List[torch.Tensor]:
+        """
+        Queue several audios for the batch worker and wait for their logits.
+        Concurrent callers are coalesced into shared padded forward passes;
+        long audios are queued as overlapping windows and stitched back.
+        Returns: one [num_frames, vocab_size] tensor per input
+        Raises ValueError for audio shorter than MIN_AUDIO_SAMPLES (no output frames).
+        """
+        for audio in audios:
+            if len(audio) < MIN_AUDIO_SAMPLES:
+                raise ValueError(
+                    f"Audio too short: {len(audio)} samples, need at least {MIN_AUDIO_SAMPLES}"
+                )
+        windowed = [_split_windows(audio) for audio in audios]
+        futures = []
+        for windows in windowed:
+            for window in windows:
+                future: Future = Future()
+                self._infer_queue.put((window, future))
+                futures.append(future)
+
+        window_logits = iter([f.result() for f in futures])
+        return [
+            _stitch_windows([next(window_logits) for _ in windows]) for windows in windowed
+        ]
+
+    def _batch_worker(self):
+        """Drain the inference queue, running up to BATCH_MAX_SIZE clips per forward pass."""
+        while True:
+            items = [self._infer_queue.get()]
+            deadline = time.monotonic() + BATCH_WINDOW_MS / 1000
+            while len(items) < BATCH_MAX_SIZE:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    items.append(self._infer_queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+
+            # Two length buckets to limit padding waste
+            short_items = [item for item in items if len(item[0]) <= BATCH_LONG_SAMPLES]
+            long_items = [item for item in items if len(item[0]) > BATCH_LONG_SAMPLES]
+            for group in (short_items, long_items):
+                if not group:
+                    continue
+                try:
+                    logits = self._compute_logits([audio for audio, _ in group])
+                except Exception as e:
+                    if len(group) == 1:
+                        group[0][1].set_exception(e)
+                        continue
+                    # One bad clip (or an OOM on the padded batch) must not fail
+                    # the other requests: retry each clip on its own
+                    logger.warning("[MODEL] Batch of %d failed, retrying singly: %s", len(group), e)
+                    for audio, future in group:
+                        try:
+                            future.set_result(self._compute_logits([audio])[0])
+                        except Exception as item_error:
+                            future.set_exception(item_error)
+                    continue
+                for (_, future), sample_logits in zip(group, logits):
+                    future.set_result(sample_logits)
+
+    def _compute_logits(self, audios: List[np.ndarray]) -> List[torch.Tensor]:
         """
-        inputs = self.processor(audio, sampling_rate=16000, return_tensors="pt", padding=True)
+        Run several audios through the model in one padded forward pass.
+        Returns: one [num_frames, vocab_size] tensor per input, with padding frames dropped
+        """
+        input_values, attention_mask = self._prepare_inputs(audios)
         
-        with torch.no_grad():
-            outputs = self.model(inputs.input_values.to(self.device))
-            logits = outputs.logits  # [batch, frames, vocab_size]
+        logits = self._forward(input_values, attention_mask)  # [batch, frames, vocab_size]
         
-        # Apply softmax to get probabilities
-        probs = torch.nn.functional.softmax(logits, dim=-1)
+        # Number of valid (non-padding) frames for each sample (mask stays on CPU)
+        frame_counts = self.model._get_feat_extract_output_lengths(attention_mask.sum(dim=-1))
         
-        return probs[0].cpu().numpy()  # [frames, vocab_size]
+        return [logits[i, :n] for i, n in enumerate(frame_counts.tolist())]
 
-    def compare_probability_sequences(self, ref_probs: np.ndarray, user_probs: np.ndarray) -> float:
+    def compare_probability_sequences(self, ref_probs: torch.Tensor, user_probs: torch.Tensor) -> float:
         """
         Compare two probability sequences using DTW + cosine similarity.
         
@@ -206,27 +626,30 @@ class PronunciationModel:
         Returns:
             Similarity score (0.0 - 1.0)
         """
-        from scipy.spatial.distance import cosine
-        
-        # Use DTW to align frames
-        # Distance function: 1 - cosine_similarity (so 0 = identical, 1 = orthogonal)
-        def cosine_dist(x, y):
-            return cosine(x.flatten(), y.flatten())
-        
-        alignment = dtw(ref_probs, user_probs, dist=cosine_dist)
+        # Cosine distance for every (ref, user) frame pair as a single GEMM:
+        # 1 - cosine_similarity (so 0 = identical, 1 = orthogonal)
+        ref_probs = ref_probs.to(user_probs.device)
+        ref_norm = torch.nn.functional.normalize(ref_probs.float(), dim=1, eps=1e-8)
+        user_norm = torch.nn.functional.normalize(user_probs.float(), dim=1, eps=1e-8)
+        cost = 1.0 - ref_norm @ user_norm.T
+
+        # Use DTW to align frames over the precomputed cost matrix. The DP is
+        # sequential, so it runs in dtw-python's compiled loop on the host after
+        # a single device-to-host copy, whatever device produced the cost.
+        alignment = dtw(cost.cpu().numpy())
+        distance, path_length = alignment.distance, len(alignment.index1)
         
         # Normalized distance to similarity
-        # alignment.distance is sum of distances along path
+        # distance is sum of distances along path
         # Normalize by path length
-        path_length = len(alignment.index1)
-        avg_dist = alignment.distance / path_length if path_length > 0 else 1.0
+        avg_dist = distance / path_length if path_length > 0 else 1.0
         
         # Convert distance (0-1) to similarity (1-0)
         similarity = max(0, 1 - avg_dist)
         
         return round(similarity, 4)
 
-    def evaluate(self, audio_bytes: bytes, reference_text: str) -> Dict[str, Any]:
+    def evaluate(self, audio_data: Union[bytes, BinaryIO], reference_text: str) -> Dict[str, Any]:
         """
         Main evaluation: compare user audio against reference text.
         
@@ -234,16 +657,45 @@ class PronunciationModel:
         1. Symbol Comparison: Compare decoded phoneme sequences (robust to speaker)
         2. Probability Comparison: Compare frame-level logits via TTS (more detailed)
         """
-        audio, _ = self.load_audio(audio_bytes)
+        cache_key = (_audio_digest(audio_data), reference_text)
+        with self._state_lock:
+            cached = self._result_cache.get(cache_key)
+        if cached is not None:
+            return dict(cached)
+
+        audio, _ = self.load_audio(audio_data)
+
+        # On a reference-cache miss the TTS audio is synthesized up front so it
+        # shares one padded forward pass with the user audio. With
+        # ZYLO_SKIP_DECISIVE=1 the reference may not be needed, so it stays lazy.
+        with self._state_lock:
+            ref_probs = self._ref_probs_cache.get(reference_text)
+        ref_audio, ref_error = None, None
+        if ref_probs is None and not self._skip_decisive:
+            try:
+                ref_audio = self._reference_audio(reference_text)
+            except Exception as e:
+                ref_error = e
         
         # =====================================================================
         # APPROACH 1: Symbol-based comparison
         # =====================================================================
-        spoken_phonemes = self.audio_to_phonemes(audio)
+        # One forward pass over the user audio serves both approaches
+        if ref_audio is not None:
+            ref_logits, user_logits = self._encode_batch([ref_audio, audio])
+            ref_probs = self._cache_ref_probs(reference_text, ref_logits)
+        else:
+            user_logits = self._encode(audio)
+        phoneme_str = self.processor.decode(torch.argmax(user_logits, dim=-1).cpu().numpy())
+        spoken_phonemes = phoneme_str.strip().split()
         expected_phonemes = self.text_to_phonemes(reference_text)
         
-        dtw_similarity = self.compute_dtw_similarity(expected_phonemes, spoken_phonemes)
-        per = self.compute_phoneme_error_rate(expected_phonemes, spoken_phonemes)
+        if expected_phonemes and spoken_phonemes == expected_phonemes:
+            # Exact match: both metrics are known without aligning
+            dtw_similarity, per = 1.0, 0.0
+        else:
+            dtw_similarity = self.compute_dtw_similarity(expected_phonemes, spoken_phonemes)
+            per = self.compute_phoneme_error_rate(expected_phonemes, spoken_phonemes)
         
         symbol_score = round(dtw_similarity * (1 - per * 0.3), 4)
         symbol_score = max(0, min(1, symbol_score))
@@ -251,19 +703,32 @@ class PronunciationModel:
         # =====================================================================
         # APPROACH 2: Probability-based comparison (TTS)
         # =====================================================================
-        try:
-            # Generate TTS audio from reference text
-            ref_audio = self.text_to_audio(reference_text)
-            
-            # Get frame-level probabilities for both audios
-            ref_probs = self.get_frame_probabilities(ref_audio)
-            user_probs = self.get_frame_probabilities(audio)
-            
-            # Compare probability sequences
-            prob_score = self.compare_probability_sequences(ref_probs, user_probs)
-        except Exception as e:
-            print(f"[WARN] Probability comparison failed: {e}")
-            prob_score = None
+        # Always runs by default. With ZYLO_SKIP_DECISIVE=1 it is skipped when the
+        # symbol score is outside (SYMBOL_SCORE_SKIP_LOW, SYMBOL_SCORE_SKIP_HIGH),
+        # saving the TTS + extra forward pass; similarity_score is then
+        # symbol-only, so the status can differ from the full comparison.
+        prob_score = None
+        prob_failed = False
+        if not self._skip_decisive or (
+            SYMBOL_SCORE_SKIP_LOW < symbol_score < SYMBOL_SCORE_SKIP_HIGH
+        ):
+            try:
+                if ref_error is not None:
+                    raise ref_error
+                if ref_probs is None:
+                    # Skip mode only: the reference was not encoded above
+                    ref_logits = self._encode(self._reference_audio(reference_text))
+                    ref_probs = self._cache_ref_probs(reference_text, ref_logits)
+
+                # User probabilities come from the logits computed above
+                user_probs = torch.softmax(user_logits, dim=-1)
+
+                # Compare probability sequences
+                prob_score = self.compare_probability_sequences(ref_probs, user_probs)
+            except Exception as e:
+                logger.warning("[MODEL] Probability comparison failed: %s", e)
+                prob_score = None
+                prob_failed = True
         
         # =====================================================================
         # COMBINED SCORE
@@ -282,7 +747,7 @@ class PronunciationModel:
         else:
             status = "mispronounced"
 
-        return {
+        result = {
             "reference_text": reference_text,
             "spoken_text": " ".join(spoken_phonemes),
             "expected_phonemes": expected_phonemes,
@@ -294,6 +759,12 @@ class PronunciationModel:
             "phoneme_error_rate": round(per, 4),
             "status": status,
         }
+        # A transient failure of the probability path must not be replayed
+        # from the cache for every retry of the same clip
+        if not prob_failed:
+            with self._state_lock:
+                self._result_cache[cache_key] = result
+        return dict(result)
 
 # Lazy model loader
 _model: Optional[PronunciationModel] = None
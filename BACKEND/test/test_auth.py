@@ -0,0 +1,32 @@
+"""
+Checks for the password helpers in api_server.
+Run from BACKEND: python -m pytest test/test_auth.py
+"""
+import os
+import sys
+
+import bcrypt
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from api_server import BCRYPT_ROUNDS, hash_password, needs_rehash, verify_password  # noqa: E402
+
+
+def test_current_hashes_do_not_need_rehash():
+    password_hash = hash_password("secret")
+    assert verify_password("secret", password_hash)
+    assert not needs_rehash(password_hash)
+
+
+@pytest.mark.parametrize("rounds", [4, 12])
+@pytest.mark.parametrize("prefix", [b"2a", b"2b"])
+def test_other_costs_need_rehash(rounds, prefix):
+    assert rounds != BCRYPT_ROUNDS
+    password_hash = bcrypt.hashpw(b"secret", bcrypt.gensalt(rounds=rounds, prefix=prefix))
+    assert needs_rehash(password_hash)
+
+
+def test_current_cost_with_2a_prefix_does_not_need_rehash():
+    password_hash = bcrypt.hashpw(b"secret", bcrypt.gensalt(rounds=BCRYPT_ROUNDS, prefix=b"2a"))
+    assert not needs_rehash(password_hash)
@@ -0,0 +1,120 @@
+"""
+Checks for PronunciationModel's inference paths on a tiny randomly initialised
+Wav2Vec2, so no checkpoint download is needed.
+Run from BACKEND: python -m pytest test/test_inference.py
+"""
+import io
+import json
+import os
+import sys
+import threading
+
+import numpy as np
+import pytest
+import soundfile as sf
+import torch
+from cachetools import LRUCache
+from transformers import (
+    Wav2Vec2Config,
+    Wav2Vec2CTCTokenizer,
+    Wav2Vec2FeatureExtractor,
+    Wav2Vec2ForCTC,
+    Wav2Vec2Processor,
+)
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pronunciation_model import PronunciationModel  # noqa: E402
+
+
+@pytest.fixture(scope="module")
+def tiny_model(tmp_path_factory):
+    """PronunciationModel on CPU around a small random model, bypassing _load."""
+    torch.manual_seed(0)
+    vocab = {"<pad>": 0, "<s>": 1, "</s>": 2, "<unk>": 3, "|": 4}
+    vocab.update({c: 5 + i for i, c in enumerate("abcdefgh")})
+    vocab_file = tmp_path_factory.mktemp("vocab") / "vocab.json"
+    vocab_file.write_text(json.dumps(vocab))
+
+    config = Wav2Vec2Config(
+        vocab_size=len(vocab),
+        hidden_size=32,
+        num_hidden_layers=2,
+        num_attention_heads=2,
+        intermediate_size=64,
+        conv_dim=(16,) * 7,
+        feat_extract_norm="layer",
+        do_stable_layer_norm=True,
+        num_conv_pos_embeddings=16,
+        num_conv_pos_embedding_groups=2,
+    )
+
+    model = object.__new__(PronunciationModel)
+    model.processor = Wav2Vec2Processor(
+        feature_extractor=Wav2Vec2FeatureExtractor(return_attention_mask=True),
+        tokenizer=Wav2Vec2CTCTokenizer(str(vocab_file)),
+    )
+    model.model = Wav2Vec2ForCTC(config).eval()
+    model.device = "cpu"
+    model._autocast_dtype = None
+    return model
+
+
+# =============================================================================
+# Micro-batching: a padded batch must not change any clip's logits
+# =============================================================================
+
+def test_padded_batch_matches_single_clips(tiny_model):
+    rng = np.random.default_rng(0)
+    audios = [rng.standard_normal(n).astype(np.float32) for n in (16000, 7000, 400, 12345)]
+
+    batched = tiny_model._compute_logits(audios)
+    for audio, logits in zip(audios, batched):
+        single = tiny_model._compute_logits([audio])[0]
+        assert logits.shape == single.shape
+        torch.testing.assert_close(logits, single, atol=1e-4, rtol=1e-4)
+
+
+# =============================================================================
+# Result cache: degraded results must not be replayed
+# =============================================================================
+
+@pytest.fixture
+def scoring_model(tiny_model, monkeypatch):
+    """tiny_model with fresh caches, encoding inline instead of via the batch worker."""
+    tiny_model._phoneme_vocab = {}
+    tiny_model._skip_decisive = False
+    tiny_model._ref_probs_cache = LRUCache(maxsize=16)
+    tiny_model._result_cache = LRUCache(maxsize=16)
+    tiny_model._state_lock = threading.Lock()
+    monkeypatch.setattr(tiny_model, "_encode_batch", tiny_model._compute_logits, raising=False)
+    # No espeak needed: fixed G2P output and noise as the "TTS" audio
+    monkeypatch.setattr(tiny_model, "text_to_phonemes", lambda text: ["h", "ə", "l", "oʊ"])
+    tts_audio = np.random.default_rng(1).standard_normal(16000).astype(np.float32)
+    monkeypatch.setattr(tiny_model, "text_to_audio", lambda text: tts_audio)
+    return tiny_model
+
+
+def _wav_bytes(audio: np.ndarray) -> bytes:
+    buf = io.BytesIO()
+    sf.write(buf, audio, 16000, format="WAV")
+    return buf.getvalue()
+
+
+def test_failed_probability_path_is_not_cached(scoring_model, monkeypatch):
+    audio = _wav_bytes(np.random.default_rng(2).standard_normal(12000).astype(np.float32) * 0.1)
+    tts_audio = scoring_model.text_to_audio
+
+    def tts_down(text):
+        raise RuntimeError("TTS unavailable")
+
+    monkeypatch.setattr(scoring_model, "text_to_audio", tts_down)
+    result = scoring_model.evaluate(audio, "hello")
+    assert result["probability_score"] is None
+    assert len(scoring_model._result_cache) == 0
+
+    # Once TTS recovers, the same clip gets the full result, which is cached
+    monkeypatch.setattr(scoring_model, "text_to_audio", tts_audio)
+    result = scoring_model.evaluate(audio, "hello")
+    assert result["probability_score"] is not None
+    assert len(scoring_model._result_cache) == 1
@@ -0,0 +1,129 @@
+"""
+Regression checks for the hand-written kernels in pronunciation_model against
+reference implementations. Run from BACKEND: python -m pytest test/test_kernels.py
+"""
+import os
+import sys
+
+import numpy as np
+import pytest
+import torch
+from dtw import dtw
+from transformers import Wav2Vec2FeatureExtractor
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pronunciation_model import (  # noqa: E402
+    FRAME_STRIDE,
+    WINDOW_OVERLAP,
+    WINDOW_SAMPLES,
+    _dtw_binary,
+    _levenshtein,
+    _normalize_padded,
+    _split_windows,
+    _stitch_windows,
+)
+
+Levenshtein = pytest.importorskip("rapidfuzz.distance").Levenshtein
+
+
+def _random_ids(rng: np.random.Generator, length: int, vocab: int = 6) -> np.ndarray:
+    return rng.integers(0, vocab, size=length).astype(np.int32)
+
+
+# =============================================================================
+# Edit distance vs rapidfuzz
+# =============================================================================
+
+@pytest.mark.parametrize("seed", range(20))
+def test_levenshtein_matches_rapidfuzz(seed):
+    rng = np.random.default_rng(seed)
+    ref = _random_ids(rng, int(rng.integers(0, 30)))
+    hyp = _random_ids(rng, int(rng.integers(0, 30)))
+    assert _levenshtein(ref, hyp) == Levenshtein.distance(ref.tolist(), hyp.tolist())
+
+
+# =============================================================================
+# Symbol DTW vs dtw-python (symmetric2) on a 0/1 mismatch cost matrix
+# =============================================================================
+
+@pytest.mark.parametrize("seed", range(20))
+def test_dtw_binary_matches_dtw_python(seed):
+    rng = np.random.default_rng(seed)
+    ref = _random_ids(rng, int(rng.integers(1, 30)))
+    hyp = _random_ids(rng, int(rng.integers(1, 30)))
+    cost = (ref[:, None] != hyp[None, :]).astype(np.float64)
+    assert _dtw_binary(ref, hyp) == pytest.approx(dtw(cost).distance)
+
+
+# =============================================================================
+# Windowed encoding vs a single-window forward
+# =============================================================================
+
+# Wav2Vec2 feature encoder conv stack (kernel, stride)
+_CONV_LAYERS = [(10, 5)] + [(3, 2)] * 4 + [(2, 2)] * 2
+
+
+def _num_frames(num_samples: int) -> int:
+    for kernel, stride in _CONV_LAYERS:
+        num_samples = (num_samples - kernel) // stride + 1
+    return num_samples
+
+
+def _fake_forward(audio: np.ndarray) -> torch.Tensor:
+    """
+    Stand-in for the model: each frame's "logits" are the audio sample at the
+    start of its receptive field, so frames are identified by their position.
+    """
+    starts = np.arange(_num_frames(len(audio))) * FRAME_STRIDE
+    return torch.from_numpy(audio[starts].astype(np.float64))[:, None]
+
+
+@pytest.mark.parametrize("num_samples", [
+    WINDOW_SAMPLES,
+    WINDOW_SAMPLES + 1,
+    WINDOW_SAMPLES + WINDOW_OVERLAP,
+    2 * WINDOW_SAMPLES - WINDOW_OVERLAP,
+    2 * WINDOW_SAMPLES - WINDOW_OVERLAP + 1,
+    3 * WINDOW_SAMPLES + 12345,
+    10 * WINDOW_SAMPLES + 7,
+])
+def test_stitched_windows_match_single_forward(num_samples):
+    # Sample values are their own indices, so misplaced frames show up
+    audio = np.arange(num_samples, dtype=np.float64)
+    windows = _split_windows(audio)
+    assert all(len(w) >= WINDOW_OVERLAP for w in windows)
+
+    stitched = _stitch_windows([_fake_forward(w) for w in windows])
+    expected = _fake_forward(audio)
+    assert stitched.shape == expected.shape
+    assert torch.equal(stitched, expected)
+
+
+def test_short_audio_is_a_single_window():
+    audio = np.zeros(WINDOW_SAMPLES, dtype=np.float32)
+    windows = _split_windows(audio)
+    assert len(windows) == 1 and windows[0] is audio
+
+
+# =============================================================================
+# GPU-side input normalization vs Wav2Vec2FeatureExtractor
+# =============================================================================
+
+@pytest.mark.parametrize("do_normalize", [True, False])
+@pytest.mark.parametrize("padding_value", [0.0, -1.0])
+def test_normalize_padded_matches_feature_extractor(do_normalize, padding_value):
+    rng = np.random.default_rng(0)
+    audios = [rng.standard_normal(n).astype(np.float32) * 0.3 + 0.1 for n in (16000, 9000, 400)]
+    fe = Wav2Vec2FeatureExtractor(
+        do_normalize=do_normalize, padding_value=padding_value, return_attention_mask=True
+    )
+    expected = fe(audios, sampling_rate=16000, padding=True, return_tensors="pt").input_values
+
+    lengths = torch.tensor([len(a) for a in audios])
+    padded = torch.zeros(len(audios), int(lengths.max()))
+    for i, audio in enumerate(audios):
+        padded[i, :len(audio)] = torch.from_numpy(audio)
+    actual = _normalize_padded(padded, lengths, do_normalize, padding_value)
+
+    torch.testing.assert_close(actual, expected, atol=1e-4, rtol=1e-4)
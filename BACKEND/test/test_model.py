@@ -1,6 +1,5 @@
 import os
 import sys
-import io
 import time
 import torch
 import numpy as np
@@ -14,9 +13,9 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 os.environ["PHONEMIZER_ESPEAK_LIBRARY"] = "/opt/homebrew/lib/libespeak.dylib"
 
 try:
-    from api_server import PronunciationModel
+    from pronunciation_model import PronunciationModel
 except ImportError:
-    print("Error: Could not import api_server. Make sure you are running this from the BACKEND/test directory.")
+    print("Error: Could not import pronunciation_model. Make sure you are running this from the BACKEND/test directory.")
     sys.exit(1)
 
 def record_audio(duration=5, fs=16000):
@@ -32,10 +31,7 @@ def record_audio(duration=5, fs=16000):
     
     sd.wait()  # Wait until recording is finished
     
-    # Convert to bytes
-    buffer = io.BytesIO()
-    sf.write(buffer, recording, fs, format='WAV')
-    return buffer.getvalue()
+    return recording, fs
 
 def test_pronunciation(use_mic=False):
     print("=" * 40)
@@ -52,12 +48,11 @@ def test_pronunciation(use_mic=False):
         print(f"Using default: '{reference_text}'")
 
     if use_mic:
-        audio_bytes = record_audio(duration=4)
-        # Save for debug
-        debug_path = os.path.join(os.path.dirname(__file__), "recorded_debug.wav")
-        with open(debug_path, "wb") as f:
-            f.write(audio_bytes)
-        print(f"[DEBUG] Recorded audio saved to {debug_path}")
+        recording, fs = record_audio(duration=4)
+        # Encode once, straight to the debug file; it is then evaluated from disk
+        audio_path = os.path.join(os.path.dirname(__file__), "recorded_debug.wav")
+        sf.write(audio_path, recording, fs)
+        print(f"[DEBUG] Recorded audio saved to {audio_path}")
     else:
         # Fallback to file if specified or if mic fails
         audio_path = os.path.join(os.path.dirname(__file__), "user_audio.wav")
@@ -66,8 +61,6 @@ def test_pronunciation(use_mic=False):
             
         if os.path.exists(audio_path):
             print(f"\n[FILE] Using existing audio file: {audio_path}")
-            with open(audio_path, 'rb') as f:
-                audio_bytes = f.read()
         else:
             print("[ERROR] No audio file found and microphone not selected.")
             return
@@ -75,7 +68,9 @@ def test_pronunciation(use_mic=False):
     # 3. Evaluate
     print(f"\n[MODEL] Evaluating pronunciation...")
     try:
-        result = model.evaluate(audio_bytes, reference_text)
+        # evaluate accepts an open binary file as well as bytes
+        with open(audio_path, "rb") as f:
+            result = model.evaluate(f, reference_text)
         
         # 4. Print Results
         print("\n" + "-" * 20 + " RESULTS " + "-" * 20)
@@ -4,7 +4,7 @@ import io
 import time
 import sounddevice as sd
 import soundfile as sf
-from phonemizer import phonemize
+from phonemizer.backend import EspeakBackend
 
 # Set espeak library path for macOS homebrew
 os.environ["PHONEMIZER_ESPEAK_LIBRARY"] = "/opt/homebrew/lib/libespeak.dylib"
@@ -26,7 +26,7 @@ def test_recording_phonemes():
     
     # 2. Get expected phonemes
     try:
-        expected_ph = phonemize(text, language="en-us", backend="espeak", strip=True)
+        expected_ph = EspeakBackend("en-us").phonemize([text], strip=True)[0]
         print(f"Expected phonemes for '{text}': {expected_ph}")
     except Exception as e:
         print(f"Phonemizer Error: {e}")
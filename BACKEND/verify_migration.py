@@ -22,24 +22,23 @@ async def verify_db():
         return False
 
     try:
-        # Try a simple command to verify connection
         # init_db is non-blocking, so we need to actually do something to check connection
         print("Ping database...")
-        # In motor, we can do a command
-        # db is a AsyncIOMotorDatabase
-        # command is on the client, or we can list collections
-        collections = await db.list_collection_names()
-        print(f"[OK] Connection successful. Collections: {collections}")
+        # ping is a constant-cost admin command and needs no collection privileges,
+        # unlike listCollections
+        await db.client.admin.command("ping")
+        print(f"[OK] Connection successful. Database: {db.name}")
         return True
     except Exception as e:
         print(f"[FAIL] Database operation failed: {e}")
         return False
 
 def verify_model_import():
-    print("\nVerifying PronunciationModel import...")
+    print("\nVerifying PronunciationModel load...")
     try:
-        # model = get_model()
-        print(f"[OK] Model loaded successfully (lazy load check complete, actual load happens on access)")
+        # Runs in a worker thread (see main), so the load overlaps the DB checks
+        model = get_model()
+        print(f"[OK] Model loaded successfully on {model.device}")
         return True
     except Exception as e:
         print(f"[FAIL] Could not import or get model: {e}")
@@ -48,8 +47,11 @@ def verify_model_import():
 async def main():
     load_dotenv()
     
+    # Start the (slow) model load first so it runs while the DB is checked
+    model_task = asyncio.create_task(asyncio.to_thread(verify_model_import))
+    
     db_ok = await verify_db()
-    model_ok = verify_model_import()
+    model_ok = await model_task
     
     if db_ok and model_ok:
         print("\nAll checks passed!")